@@ -12,6 +12,7 @@ This module coordinates the overall program flow:
     2) File statistics
     3) Filename/pattern search
 - Dispatches execution to the appropriate mode module
+  (imported lazily, so only the selected mode is loaded)
 
 Design notes:
 - This module is the "controller" / orchestrator.
@@ -20,8 +21,9 @@ Design notes:
   as `default_directory` (unless --no-config is used).
 """
 
-import argparse
 import os
+import sys
+from types import SimpleNamespace
 
 from fca.prompts import (
     ask_yes_no,
@@ -38,11 +40,15 @@ from fca.config import (
     included_extensions,
     default_directory,
 )
-from fca.search_mode import run as run_search
-from fca.stats_mode import run as run_stats
-from fca.name_search_mode import run as run_name_search
 from fca.reporting import PROGRAM_NAME, PROGRAM_VERSION
 
+# Main entry file path, resolved once from the package directory.
+# This is used as a stable anchor for locating config.json next to the entry script.
+ENTRY_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "file_content_analyzer.py",
+)
+
 
 def edit_config_interactive(cfg: dict) -> None:
     """
@@ -78,8 +84,6 @@ def edit_config_interactive(cfg: dict) -> None:
     if "excluded_dirs" not in cfg:
         cfg["excluded_dirs"] = sorted(list(merged_excluded_dirs(cfg)))
 
-    print("\nConfiguration saved.\n")
-
 
 def parse_args():
     """
@@ -87,7 +91,27 @@ def parse_args():
 
     If a mode flag is provided, the tool can run with fewer prompts.
     If flags are not provided, the tool uses interactive prompts.
+
+    With no arguments at all (the common interactive / double-click case)
+    the defaults are returned directly, without importing or building the
+    argparse parser.
     """
+    if len(sys.argv) <= 1:
+        return SimpleNamespace(
+            search=False,
+            stats=False,
+            names=False,
+            dir=None,
+            case_sensitive=False,
+            include=None,
+            exclude=None,
+            no_config=False,
+            edit_config=False,
+            max_count=None,
+        )
+
+    import argparse
+
     p = argparse.ArgumentParser()
     p.add_argument("--search", action="store_true", help="Run string search mode")
     p.add_argument("--stats", action="store_true", help="Run file statistics mode")
@@ -98,7 +122,12 @@ def parse_args():
     p.add_argument("--exclude", help="Exclude these extensions (comma-separated, no dots)")
     p.add_argument("--no-config", action="store_true", help="Ignore config.json and do not write it")
     p.add_argument("--edit-config", action="store_true", help="Edit config interactively and exit")
-    return p.parse_args()
+    p.add_argument("--max-count", type=int, metavar="N",
+                   help="String search: stop counting a string in a file after N occurrences")
+    args = p.parse_args()
+    if args.max_count is not None and args.max_count < 1:
+        p.error("--max-count must be at least 1")
+    return args
 
 
 def main() -> None:
@@ -106,57 +135,60 @@ def main() -> None:
     Main program entry for CLI orchestration.
 
     Responsibilities:
-    - Resolve entry_file path (used to locate config.json next to it)
+    - Use ENTRY_FILE (resolved at import) to locate config.json next to it
     - Load config and apply defaults
     - Optionally edit config interactively
     - Determine mode and directory
     - Dispatch to the selected mode
     - Remember the last-used directory in config.json (unless --no-config)
     """
-    # Resolve the main entry file path from the package directory.
-    # This is used as a stable anchor for locating config.json next to the entry script.
-    entry_file = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        "file_content_analyzer.py",
-    )
+    entry_file = ENTRY_FILE
 
     # Startup banner
-    print(f"\n{PROGRAM_NAME} v{PROGRAM_VERSION}")
-    print("=" * (len(PROGRAM_NAME) + len(PROGRAM_VERSION) + 3))
+    rule = "=" * (len(PROGRAM_NAME) + len(PROGRAM_VERSION) + 3)
+    print(f"\n{PROGRAM_NAME} v{PROGRAM_VERSION}\n{rule}")
 
     args = parse_args()
 
     # Load configuration unless explicitly disabled
     cfg = {} if args.no_config else load_config(entry_file)
 
-    # Ensure excluded_dirs exists in cfg (merge defaults)
-    if "excluded_dirs" not in cfg:
-        cfg["excluded_dirs"] = sorted(list(merged_excluded_dirs(cfg)))
+    # Track whether cfg needs to be written back; the remaining changes are
+    # saved once, after all of them are known.
+    cfg_dirty = False
 
     # One-shot mode: edit config and exit
     if args.edit_config:
         edit_config_interactive(cfg)
         if not args.no_config:
             save_config(entry_file, cfg)
+            print("\nConfiguration saved.\n")
         return
 
-    # Optional: allow user to tweak config at runtime
+    # Optional: allow user to tweak config at runtime.
+    # Edits are saved right away, so an interrupt at a later prompt does not
+    # lose them; the final save skips the write if nothing else changed.
     if ask_yes_no("Edit configuration?", default=False):
         edit_config_interactive(cfg)
         if not args.no_config:
             save_config(entry_file, cfg)
+            print("\nConfiguration saved.\n")
 
     # CLI overrides (one-run; we also persist unless --no-config)
     if args.include is not None:
         cfg["included_extensions"] = normalize_ext_list(args.include.split(","))
+        cfg_dirty = True
     if args.exclude is not None:
         cfg["excluded_extensions"] = normalize_ext_list(args.exclude.split(","))
+        cfg_dirty = True
 
-    if not args.no_config:
-        save_config(entry_file, cfg)
-
-    # Prepare filters for traversal
-    excluded_dirs = set(cfg.get("excluded_dirs", []))
+    # Prepare filters for traversal.
+    # Defaults for excluded_dirs are applied here without being written into
+    # cfg; they are only persisted when the config editor is used.
+    if "excluded_dirs" in cfg:
+        excluded_dirs = set(cfg["excluded_dirs"])
+    else:
+        excluded_dirs = merged_excluded_dirs(cfg)
     excluded_exts = excluded_extensions(cfg)
     included_exts = included_extensions(cfg)
 
@@ -177,15 +209,21 @@ def main() -> None:
         default_path=cfg_default_dir,
     )
 
-    # Remember last-used directory (absolute), unless config is disabled
     if not args.no_config:
+        # Remember last-used directory (absolute)
         abs_dir = os.path.abspath(directory)
-        if os.path.isdir(abs_dir):
+        if os.path.isdir(abs_dir) and cfg.get("default_directory") != abs_dir:
             cfg["default_directory"] = abs_dir
+            cfg_dirty = True
+
+        # Persist all config changes for this run in a single write
+        if cfg_dirty:
             save_config(entry_file, cfg)
 
-    # Dispatch to the selected mode
+    # Dispatch to the selected mode.
+    # Mode modules are imported here so only the one actually used is loaded.
     if mode == 1:
+        from fca.search_mode import run as run_search
         case_sensitive = args.case_sensitive or ask_yes_no(
             "Case-sensitive search?", default=False
         )
@@ -197,9 +235,11 @@ def main() -> None:
             excluded_dirs=excluded_dirs,
             excluded_exts=excluded_exts,
             included_exts=included_exts,
+            max_count=args.max_count,
         )
 
     elif mode == 2:
+        from fca.stats_mode import run as run_stats
         out = run_stats(
             entry_file=entry_file,
             directory=directory,
@@ -209,6 +249,7 @@ def main() -> None:
         )
 
     else:
+        from fca.name_search_mode import run as run_name_search
         out = run_name_search(
             entry_file=entry_file,
             directory=directory,
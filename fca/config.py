@@ -23,6 +23,10 @@ from typing import Any
 CONFIG_FILENAME = "config.json"
 DEFAULT_EXCLUDE_DIRS = {".venv", ".vscode"}
 
+# Last known on-disk contents of config.json, keyed by path.
+# Lets save_config() skip rewriting a file that would not change.
+_last_contents = {}
+
 
 def script_dir(entry_file: str) -> str:
     """Return the directory where the main entry script resides."""
@@ -42,14 +46,30 @@ def load_config(entry_file: str) -> dict:
     - the file does not exist
     - the file is unreadable
     - the file contains invalid JSON
+
+    The file is small, so it is read with a raw file descriptor in one go
+    rather than through a buffered text stream.
     """
     path = config_path(entry_file)
-    if not os.path.isfile(path):
-        return {}
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            chunks = []
+            size = max(os.fstat(fd).st_size, 1)
+            while True:
+                chunk = os.read(fd, size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+
+        # Normalize line endings like text-mode reads do (config.json is
+        # written in text mode, so it has CRLF endings on Windows).
+        text = b"".join(chunks).decode("utf-8").replace("\r\n", "\n")
+        _last_contents[path] = text
+        data = json.loads(text)
         return data if isinstance(data, dict) else {}
     except Exception:
         return {}
@@ -60,10 +80,27 @@ def save_config(entry_file: str, cfg: dict) -> None:
     Save the configuration to config.json next to the entry script.
 
     Writes pretty-printed JSON with 2-space indentation.
+    The write is skipped if the file already holds exactly this content.
     """
     path = config_path(entry_file)
+    text = json.dumps(cfg, indent=2)
+    if _last_contents.get(path) == text:
+        return
+
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+        f.write(text)
+    _last_contents[path] = text
+
+
+def normalize_ext(value: str) -> str:
+    """
+    Normalize a single file extension: strip whitespace, lowercase,
+    remove a leading dot. Returns "" for empty input.
+
+    Example:
+        " .Py " -> "py"
+    """
+    return value.strip().lower().lstrip(".")
 
 
 def normalize_ext_list(values: Any) -> list:
@@ -81,9 +118,7 @@ def normalize_ext_list(values: Any) -> list:
     if not isinstance(values, (list, tuple, set)):
         return []
 
-    cleaned = {str(v).strip().lower().lstrip(".") for v in values if str(v).strip()}
-    cleaned.discard("")  # just in case
-    return sorted(cleaned)
+    return sorted({e for e in (normalize_ext(str(v)) for v in values) if e})
 
 
 def merged_excluded_dirs(cfg: dict) -> set:
@@ -16,11 +16,13 @@ This module focuses on collecting results; report writing is done via fca.report
 """
 
 import os
+import re
 import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 
-from fca.traversal import iter_files
+from fca.traversal import iter_file_names, split_top_level, file_id, IO_WORKERS
 from fca.reporting import write_name_search_report
-from fca.prompts import ask_yes_no
+from fca.prompts import ask_yes_no, ask_lines
 
 
 def load_name_patterns(entry_file: str) -> list | None:
@@ -49,46 +51,119 @@ def load_name_patterns(entry_file: str) -> list | None:
                 pass
 
     if ask_yes_no("Add filename patterns manually?", default=not bool(patterns)):
-        print("Enter filename patterns (empty line to finish). Examples:")
-        print("  - config.json")
-        print("  - *.php")
-        print("  - style*.css")
-        print("  - *checkout*")
-        while True:
-            s = input("> ").strip()
-            if not s:
-                break
-            patterns.append(s)
+        patterns.extend(ask_lines(
+            "Enter filename patterns (empty line to finish). Examples:\n"
+            "  - config.json\n"
+            "  - *.php\n"
+            "  - style*.css\n"
+            "  - *checkout*"
+        ))
 
     if not patterns:
         return None
 
     # De-dupe while preserving order
-    seen = set()
-    unique = []
+    return list(dict.fromkeys(patterns))
+
+
+_GLOB_META = frozenset("*?[")
+
+
+def _compile_patterns(patterns: list, case_sensitive: bool) -> tuple:
+    """
+    Prepare the patterns for matching once, up front.
+
+    Patterns without glob metacharacters (e.g. `config.json`) are plain
+    names and are matched with a dict lookup. The remaining glob patterns
+    are translated to compiled regexes.
+
+    Returns a tuple (literals, combined, compiled):
+    - literals: dict name -> list of original patterns equal to that name
+    - combined: a single regex with one named alternative per glob pattern
+      (`p0`, `p1`, ...), so one match call per file tells whether any
+      glob hits and which one hits first; None if there are no globs
+    - compiled: a list of (original_pattern, compiled_regex) pairs for the
+      globs, used to collect any further globs that match the same filename
+
+    For case-insensitive matching the patterns are lowercased here, so the
+    caller only needs to lowercase each filename once.
+    """
+    literals = {}
+    compiled = []
+    parts = []
     for p in patterns:
-        if p not in seen:
-            seen.add(p)
-            unique.append(p)
+        key = p if case_sensitive else p.lower()
+        if _GLOB_META.isdisjoint(key):
+            literals.setdefault(key, []).append(p)
+            continue
+
+        regex = fnmatch.translate(key)
+        group = f"p{len(compiled)}"
+        compiled.append((p, re.compile(regex)))
+        if regex.endswith(r"\Z"):
+            regex = regex[:-2]
+        parts.append(f"(?P<{group}>{regex})")
 
-    return unique
+    combined = re.compile("(?:" + "|".join(parts) + r")\Z") if parts else None
+    return literals, combined, compiled
 
 
-def _matches_any_pattern(filename: str, patterns: list, case_sensitive: bool) -> list:
+def _matches_any_pattern(filename: str, matcher: tuple, case_sensitive: bool) -> list:
     """
     Return a list of patterns that match filename (may be multiple).
-    """
-    if case_sensitive:
-        return [p for p in patterns if fnmatch.fnmatchcase(filename, p)]
 
-    lower_name = filename.lower()
-    matches = []
-    for p in patterns:
-        if fnmatch.fnmatchcase(lower_name, p.lower()):
+    `matcher` is the output of _compile_patterns().
+    """
+    literals, combined, compiled = matcher
+    target = filename if case_sensitive else filename.lower()
+
+    matches = list(literals.get(target, ()))
+    if combined is None:
+        return matches
+
+    m = combined.match(target)
+    if m is None:
+        return matches
+
+    # The alternation stops at the first pattern that matches; only the
+    # patterns after it still need an individual check. The pattern groups
+    # are outermost, so the last group closed is the one that matched.
+    first = int(m.lastgroup[1:])
+    matches.append(compiled[first][0])
+    for p, rx in compiled[first + 1:]:
+        if rx.match(target):
             matches.append(p)
     return matches
 
 
+def _search_names(file_names, matcher: tuple, case_sensitive: bool,
+                  script_name: str | None, script_id: tuple | None) -> list:
+    """
+    Match (root, name) pairs against the compiled patterns.
+
+    Returns a flat list of (pattern, full_path) pairs, one per hit.
+    Grouping by pattern is done once, after all workers are finished.
+    """
+    hits = []
+
+    # Match on the bare file name; the full path is only built for hits.
+    for root, name in file_names:
+        matched_patterns = _matches_any_pattern(name, matcher, case_sensitive)
+        if not matched_patterns:
+            continue
+
+        path = os.path.join(root, name)
+
+        # Skip the program file itself (only stat'ed on a name collision)
+        if name == script_name and file_id(path) == script_id:
+            continue
+
+        for p in matched_patterns:
+            hits.append((p, path))
+
+    return hits
+
+
 def run(entry_file: str, directory: str, excluded_dirs: set, excluded_exts: set, included_exts: set) -> str | None:
     """
     Search for files by name/pattern within directory (recursive).
@@ -102,19 +177,31 @@ def run(entry_file: str, directory: str, excluded_dirs: set, excluded_exts: set,
 
     case_sensitive = ask_yes_no("Should filename matching be case-sensitive?", default=False)
 
-    # Map: pattern -> list of full paths
-    hits_by_pattern = {p: [] for p in patterns}
+    matcher = _compile_patterns(patterns, case_sensitive)
 
-    script_path = os.path.abspath(entry_file)
+    script_id = file_id(entry_file)
+    script_name = os.path.basename(entry_file) if script_id else None
 
-    for path in iter_files(directory, excluded_dirs, excluded_exts, included_exts):
-        # Skip the program file itself
-        if os.path.abspath(path) == script_path:
-            continue
+    # Top-level files are matched here; each top-level subdirectory is
+    # walked and matched by its own worker thread.
+    top_files, subdirs = split_top_level(directory, excluded_dirs, excluded_exts, included_exts)
 
-        name = os.path.basename(path)
-        matched_patterns = _matches_any_pattern(name, patterns, case_sensitive)
-        for p in matched_patterns:
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+        futures = [
+            pool.submit(
+                _search_names,
+                iter_file_names(sub, excluded_dirs, excluded_exts, included_exts),
+                matcher, case_sensitive, script_name, script_id,
+            )
+            for sub in subdirs
+        ]
+        partial_hits = [_search_names(top_files, matcher, case_sensitive, script_name, script_id)]
+        partial_hits.extend(f.result() for f in futures)
+
+    # Map: pattern -> list of full paths
+    hits_by_pattern = {p: [] for p in patterns}
+    for hits in partial_hits:
+        for p, path in hits:
             hits_by_pattern[p].append(path)
 
     out = write_name_search_report(
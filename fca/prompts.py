@@ -10,12 +10,53 @@ Responsibilities:
 - menu selection prompts
 - directory selection prompts (supports a remembered default path)
 - extension list input parsing
+- multi-line list input (search strings, filename patterns)
 
 Keeping prompts here avoids duplicating input logic
 across different modes and keeps the CLI flow readable.
 """
 
 import os
+import sys
+
+from fca.config import normalize_ext
+
+
+def _batch_mode() -> bool:
+    """
+    Return True when prompts should be answered with their defaults.
+
+    Enabled by setting the environment variable FCA_BATCH=1 while stdin is
+    not a terminal (e.g. scheduled or scripted runs).
+    """
+    return os.environ.get("FCA_BATCH") == "1" and not sys.stdin.isatty()
+
+
+def _prompt(msg: str, has_default: bool = False) -> str:
+    """
+    Show msg and return one line of user input (without the line ending).
+
+    - Interactive terminals use input(), which keeps line editing.
+    - Piped / redirected stdin is read with a single readline() after one
+      explicit flush of stdout.
+    - In batch mode (see _batch_mode), prompts that have a default return
+      "" immediately, which every caller treats as "use the default".
+
+    Raises EOFError when stdin is exhausted, like input().
+    """
+    if has_default and _batch_mode():
+        print(msg)
+        return ""
+
+    if sys.stdin.isatty():
+        return input(msg)
+
+    sys.stdout.write(msg)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\r\n")
 
 
 def ask_yes_no(prompt: str, default=None) -> bool:
@@ -37,7 +78,7 @@ def ask_yes_no(prompt: str, default=None) -> bool:
         suffix = " (y/n) [n]: "
 
     while True:
-        ans = input(prompt + suffix).strip().lower()
+        ans = _prompt(prompt + suffix, has_default=default is not None).strip().lower()
 
         # ENTER selects default, if provided
         if ans == "":
@@ -61,13 +102,15 @@ def ask_menu_choice() -> int:
     Returns:
         int: 1 (string search), 2 (file stats), 3 (filename search).
     """
-    print("\nChoose an operation:")
-    print("  1) Search for strings in files")
-    print("  2) Count lines, words, and characters in files")
-    print("  3) Search for files by name (patterns)")
+    print(
+        "\nChoose an operation:\n"
+        "  1) Search for strings in files\n"
+        "  2) Count lines, words, and characters in files\n"
+        "  3) Search for files by name (patterns)"
+    )
 
     while True:
-        choice = input("\nEnter choice [1]: ").strip()
+        choice = _prompt("\nEnter choice [1]: ", has_default=True).strip()
         if choice == "":
             return 1
         if choice in {"1", "2", "3"}:
@@ -101,13 +144,14 @@ def choose_directory(action_word: str, default_path: str | None = None) -> str:
 
     while True:
         if default_path:
-            path = input(
-                f"Enter full directory path to {action_word.lower()} [{default_path}]: "
+            path = _prompt(
+                f"Enter full directory path to {action_word.lower()} [{default_path}]: ",
+                has_default=os.path.isdir(default_path),
             ).strip()
             if path == "":
                 path = default_path
         else:
-            path = input(
+            path = _prompt(
                 f"Enter full directory path to {action_word.lower()}: "
             ).strip()
 
@@ -131,9 +175,42 @@ def ask_extensions_list(label: str) -> set:
     Returns:
         set[str]: {"py", "txt", "js"}
     """
-    raw = input(label + " ").strip()
-    parts = [p.strip().lower().lstrip(".") for p in raw.split(",") if p.strip()]
-    return set(parts)
+    raw = _prompt(label + " ", has_default=True).strip()
+    return {e for e in map(normalize_ext, raw.split(",")) if e}
+
+
+def ask_lines(header: str) -> list:
+    """
+    Read a list of entries, one per line, until an empty line.
+
+    - Interactive terminals show a "> " prompt for every entry.
+    - Piped / redirected stdin is read with readline() only: no prompt is
+      written and flushed per entry. The input is not read in bulk, since
+      answers to later prompts may follow the empty line.
+    End of input also finishes the list.
+
+    Returns:
+        list[str]: the entries, stripped, in input order.
+    """
+    print(header)
+    tty = sys.stdin.isatty()
+    if not tty:
+        sys.stdout.flush()
+
+    entries = []
+    while True:
+        if tty:
+            try:
+                line = input("> ")
+            except EOFError:
+                break
+        else:
+            line = sys.stdin.readline()
+        s = line.strip()
+        if not s:
+            break
+        entries.append(s)
+    return entries
 
 
 # End of file prompts.py
\ No newline at end of file
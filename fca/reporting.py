@@ -24,6 +24,10 @@ PROGRAM_VERSION = "3.0.0"
 
 RESULTS_DIRNAME = "analysis-results"
 
+# Per-record templates for the longest report loops
+SEARCH_TERM_LINE = "  %s: %d\n"
+STATS_FILE_BLOCK = "%s\n  Lines: %d\n  Words: %d\n  Characters: %d\n\n"
+
 
 def make_output_file(entry_file: str, prefix: str) -> str:
     base_dir = os.path.dirname(os.path.abspath(entry_file))
@@ -33,98 +37,137 @@ def make_output_file(entry_file: str, prefix: str) -> str:
     return os.path.join(out_dir, f"{prefix}_{ts}.txt")
 
 
-def write_search_report(entry_file: str, directory: str, case_sensitive: bool, strings: list, results: dict) -> str:
+def write_search_report(entry_file: str, directory: str, case_sensitive: bool, strings: list, results: dict,
+                        max_count: int | None = None) -> str:
+    """
+    Write the string search report.
+
+    results holds the matches column-wise: "paths" (files with at least one
+    match, in report order), "offsets", "term_ids" and "counts". File i has
+    its matches at offsets[i]:offsets[i + 1] of term_ids (index into
+    strings) and counts.
+
+    max_count, if the search was capped, is listed in the header; counts
+    equal to it mean "at least max_count".
+    """
     out = make_output_file(entry_file, "string_search")
+
+    # The report is assembled in memory and written with a single call.
+    parts = [
+        f"{PROGRAM_NAME} v{PROGRAM_VERSION}\n",
+        "String Search Report\n\n",
+        f"Directory: {os.path.abspath(directory)}\n",
+        f"Case-sensitive: {case_sensitive}\n",
+    ]
+    if max_count is not None:
+        parts.append(f"Max count per string and file: {max_count}\n")
+    parts.append("Search strings:\n")
+    for s in strings:
+        parts.append(f"  - {s}\n")
+    parts.append("\n")
+
+    paths = results["paths"]
+    if not paths:
+        parts.append("No matches found.\n")
+    else:
+        offsets = results["offsets"]
+        term_ids = results["term_ids"]
+        counts = results["counts"]
+
+        parts.append(f"Total files with matches: {len(paths)}\n")
+        parts.append(f"Total occurrences: {sum(counts)}\n\n")
+
+        for i, path in enumerate(paths):
+            parts.append(path + "\n")
+            for j in range(offsets[i], offsets[i + 1]):
+                parts.append(SEARCH_TERM_LINE % (strings[term_ids[j]], counts[j]))
+            parts.append("\n")
+
     with open(out, "w", encoding="utf-8") as f:
-        f.write(f"{PROGRAM_NAME} v{PROGRAM_VERSION}\n")
-        f.write("String Search Report\n\n")
-        f.write(f"Directory: {os.path.abspath(directory)}\n")
-        f.write(f"Case-sensitive: {case_sensitive}\n")
-        f.write("Search strings:\n")
-        for s in strings:
-            f.write(f"  - {s}\n")
-        f.write("\n")
-
-        if not results:
-            f.write("No matches found.\n")
-            return out
-
-        total_files = len(results)
-        total_occ = sum(sum(d.values()) for d in results.values())
-        f.write(f"Total files with matches: {total_files}\n")
-        f.write(f"Total occurrences: {total_occ}\n\n")
-
-        for path, counts in results.items():
-            f.write(path + "\n")
-            for term, count in counts.items():
-                f.write(f"  {term}: {count}\n")
-            f.write("\n")
+        f.write("".join(parts))
 
     return out
 
 
 def write_stats_report(entry_file: str, directory: str, per_file: dict, per_ext: dict) -> str:
+    """
+    Write the file statistics report.
+
+    per_file holds parallel columns: "paths" (list of str) and "lines",
+    "words", "chars" (sequences of int); index i describes one file.
+    per_ext maps ext -> [files, lines, words, chars].
+    """
     out = make_output_file(entry_file, "file_stats")
+
+    paths = per_file["paths"]
+    lines = per_file["lines"]
+    words = per_file["words"]
+    chars = per_file["chars"]
+
+    total_files = len(paths)
+    total_lines = sum(lines)
+    total_words = sum(words)
+    total_chars = sum(chars)
+
+    # The report is assembled in memory and written with a single call.
+    parts = [
+        f"{PROGRAM_NAME} v{PROGRAM_VERSION}\n",
+        "File Statistics Report\n\n",
+        f"Directory: {os.path.abspath(directory)}\n\n",
+        "Summary:\n",
+        f"  Total files: {total_files}\n",
+        f"  Total lines: {total_lines}\n",
+        f"  Total words: {total_words}\n",
+        f"  Total characters: {total_chars}\n\n",
+        "Per-extension totals:\n",
+    ]
+    for ext, (n_files, n_lines, n_words, n_chars) in sorted(per_ext.items()):
+        parts.append(f"  .{ext}  files={n_files} lines={n_lines} words={n_words} chars={n_chars}\n")
+    parts.append("\n")
+
+    parts.append("Per-file details:\n")
+    for i in sorted(range(total_files), key=paths.__getitem__):
+        parts.append(STATS_FILE_BLOCK % (paths[i], lines[i], words[i], chars[i]))
+
     with open(out, "w", encoding="utf-8") as f:
-        f.write(f"{PROGRAM_NAME} v{PROGRAM_VERSION}\n")
-        f.write("File Statistics Report\n\n")
-        f.write(f"Directory: {os.path.abspath(directory)}\n\n")
-
-        total_files = len(per_file)
-        total_lines = sum(v["lines"] for v in per_file.values())
-        total_words = sum(v["words"] for v in per_file.values())
-        total_chars = sum(v["chars"] for v in per_file.values())
-
-        f.write("Summary:\n")
-        f.write(f"  Total files: {total_files}\n")
-        f.write(f"  Total lines: {total_lines}\n")
-        f.write(f"  Total words: {total_words}\n")
-        f.write(f"  Total characters: {total_chars}\n\n")
-
-        f.write("Per-extension totals:\n")
-        for ext in sorted(per_ext.keys()):
-            d = per_ext[ext]
-            f.write(f"  .{ext}  files={d['files']} lines={d['lines']} words={d['words']} chars={d['chars']}\n")
-        f.write("\n")
-
-        f.write("Per-file details:\n")
-        for path in sorted(per_file.keys()):
-            s = per_file[path]
-            f.write(path + "\n")
-            f.write(f"  Lines: {s['lines']}\n")
-            f.write(f"  Words: {s['words']}\n")
-            f.write(f"  Characters: {s['chars']}\n\n")
+        f.write("".join(parts))
 
     return out
-  
+
+
 def write_name_search_report(entry_file: str, directory: str, case_sensitive: bool, patterns: list, hits_by_pattern: dict) -> str:
     out = make_output_file(entry_file, "name_search")
+
+    # The report is assembled in memory and written with a single call.
+    parts = [
+        f"{PROGRAM_NAME} v{PROGRAM_VERSION}\n",
+        "Filename Search Report\n\n",
+        f"Directory: {os.path.abspath(directory)}\n",
+        f"Case-sensitive: {case_sensitive}\n\n",
+        "Patterns searched:\n",
+    ]
+    for p in patterns:
+        parts.append(f"  - {p}\n")
+    parts.append("\n")
+
+    total_matches = sum(len(paths) for paths in hits_by_pattern.values())
+    total_patterns_with_hits = sum(1 for p in patterns if hits_by_pattern.get(p))
+
+    parts.append(f"Patterns with matches: {total_patterns_with_hits} / {len(patterns)}\n")
+    parts.append(f"Total matching files: {total_matches}\n\n")
+
+    for p in patterns:
+        paths = hits_by_pattern.get(p, [])
+        parts.append(f"Pattern: {p}\n")
+        if not paths:
+            parts.append("  (no matches)\n\n")
+            continue
+
+        for path in sorted(paths):
+            parts.append(f"  {path}\n")
+        parts.append("\n")
+
     with open(out, "w", encoding="utf-8") as f:
-        f.write(f"{PROGRAM_NAME} v{PROGRAM_VERSION}\n")
-        f.write("Filename Search Report\n\n")
-        f.write(f"Directory: {os.path.abspath(directory)}\n")
-        f.write(f"Case-sensitive: {case_sensitive}\n\n")
-
-        f.write("Patterns searched:\n")
-        for p in patterns:
-            f.write(f"  - {p}\n")
-        f.write("\n")
-
-        total_matches = sum(len(paths) for paths in hits_by_pattern.values())
-        total_patterns_with_hits = sum(1 for p in patterns if hits_by_pattern.get(p))
-
-        f.write(f"Patterns with matches: {total_patterns_with_hits} / {len(patterns)}\n")
-        f.write(f"Total matching files: {total_matches}\n\n")
-
-        for p in patterns:
-            paths = hits_by_pattern.get(p, [])
-            f.write(f"Pattern: {p}\n")
-            if not paths:
-                f.write("  (no matches)\n\n")
-                continue
-
-            for path in sorted(paths):
-                f.write(f"  {path}\n")
-            f.write("\n")
-
-    return out
\ No newline at end of file
+        f.write("".join(parts))
+
+    return out
@@ -0,0 +1,112 @@
+"""
+String Search Cache
+
+This module persists per-file string-search counts between runs, so a
+repeated search over the same tree only reads files that have changed.
+
+Responsibilities:
+- locate the cache file under analysis-results/.cache/
+- load cached counts for a given search (directory, strings and options)
+- save updated counts (atomically, best effort)
+
+The cache holds one search at a time: it is keyed by a hash of the
+searched directory, the search strings, the case setting and the count
+cap, and a search with different settings starts from an empty cache and
+replaces it. Only the hash is stored, never the strings themselves. The
+cache does hold file paths, so string search skips the cache file itself
+(like the entry script) when it searches the program's own folder.
+
+Entries are validated by the caller against the file's size and
+modification time (see search_mode).
+"""
+
+import hashlib
+import json
+import os
+
+from fca.config import script_dir
+from fca.reporting import RESULTS_DIRNAME
+
+
+CACHE_DIRNAME = ".cache"
+SEARCH_CACHE_FILENAME = "string_search.json"
+
+
+def search_cache_path(entry_file: str) -> str:
+    """Return the full path to the string-search cache file."""
+    return os.path.join(script_dir(entry_file), RESULTS_DIRNAME, CACHE_DIRNAME, SEARCH_CACHE_FILENAME)
+
+
+def search_key(directory: str, strings: list, case_sensitive: bool, max_count: int | None = None) -> str:
+    """
+    Return the cache key for a search: the directory (made absolute, so
+    relative file paths always refer to the same files), the search
+    strings, the case setting and the per-file count cap.
+    """
+    raw = json.dumps(
+        [os.path.abspath(directory), strings, case_sensitive, max_count],
+        ensure_ascii=False,
+    ).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _valid_entry(entry, n_strings: int) -> bool:
+    """Return True if entry has the [mtime_ns, size, counts] layout."""
+    if not (isinstance(entry, list) and len(entry) == 3):
+        return False
+    mtime_ns, size, counts = entry
+    return (
+        type(mtime_ns) is int
+        and type(size) is int
+        and isinstance(counts, list)
+        and len(counts) in (0, n_strings)
+        and all(type(c) is int for c in counts)
+    )
+
+
+def load_search_cache(entry_file: str, key: str, n_strings: int) -> dict:
+    """
+    Load cached per-file counts for the search identified by key, for a
+    search with n_strings search strings.
+
+    Returns a dict {path: [mtime_ns, size, counts]}, where counts lists the
+    count of each search string in order (empty list if none occur).
+    Malformed entries (e.g. from a hand-edited or damaged file) are left
+    out, so those files are simply scanned again.
+
+    Returns an empty dict if:
+    - the cache file does not exist or cannot be read
+    - it holds results for a different search
+    """
+    try:
+        with open(search_cache_path(entry_file), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("key") != key:
+            return {}
+        files = data.get("files")
+        if not isinstance(files, dict):
+            return {}
+        return {path: entry for path, entry in files.items() if _valid_entry(entry, n_strings)}
+    except Exception:
+        return {}
+
+
+def save_search_cache(entry_file: str, key: str, files: dict) -> None:
+    """
+    Replace the cache with the given per-file counts (same layout as
+    load_search_cache() returns).
+
+    The file is written next to its final location and then renamed over
+    it, so an interrupted run never leaves a truncated cache behind.
+    Failures are ignored: the cache only saves work, results never depend
+    on it.
+    """
+    path = search_cache_path(entry_file)
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"key": key, "files": files}, separators=(",", ":")))
+        os.replace(tmp, path)
+    except OSError:
+        pass
@@ -8,6 +8,7 @@ Responsibilities:
 - perform string occurrence counting per file
 - apply case-sensitive or case-insensitive matching
 - skip the program file itself
+- reuse cached counts for files unchanged since the last identical search
 - return structured results for reporting
 
 It does not handle:
@@ -17,8 +18,19 @@ It does not handle:
 """
 
 import os
-from fca.traversal import iter_files
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from fca.traversal import iter_files, iter_text_chunks, map_in_batches, IO_WORKERS
 from fca.reporting import write_search_report
+from fca.scan_cache import load_search_cache, save_search_cache, search_cache_path, search_key
+
+# Files modified less than this long before a search starts are not cached:
+# on file systems with coarse timestamps, a further change within the same
+# tick could leave both size and modification time unchanged.
+CACHE_RACY_WINDOW_NS = 2_000_000_000
 
 
 def load_search_strings(entry_file: str) -> list | None:
@@ -30,61 +42,237 @@ def load_search_strings(entry_file: str) -> list | None:
         from fca.prompts import ask_yes_no
         if ask_yes_no("Found search-strings.txt. Use it?", default=True):
             with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    s = line.strip()
-                    if s and not s.startswith("//"):
-                        strings.append(s)
+                lines = f.read().split("\n")
+            stripped = (line.strip() for line in lines)
+            strings.extend(s for s in stripped if s and not s.startswith("//"))
 
-    from fca.prompts import ask_yes_no
+    from fca.prompts import ask_yes_no, ask_lines
     if ask_yes_no("Add search strings manually?", default=not bool(strings)):
-        print("Enter search strings (empty line to finish):")
-        while True:
-            s = input("> ").strip()
-            if not s:
-                break
-            strings.append(s)
+        strings.extend(ask_lines("Enter search strings (empty line to finish):"))
 
     if not strings:
         return None
 
     # de-dupe preserve order
-    seen = set()
-    out = []
-    for s in strings:
-        if s not in seen:
-            seen.add(s)
-            out.append(s)
-    return out
+    return list(dict.fromkeys(strings))
+
+
+# UTF-8 encodings of the only non-ASCII characters whose str.lower() contains
+# ASCII letters: "\u0130" (I with dot above -> "i\u0307") and "\u212a" (Kelvin
+# sign -> "k"). Without them, bytes.lower() finds every ASCII-term match
+# that str.lower() would.
+_LOWER_TO_ASCII = ("\u0130".encode("utf-8"), "\u212a".encode("utf-8"))
+
+
+def _count_upto(hay, term, count: int, limit: int) -> int:
+    """
+    Add the occurrences of term in hay to count, stopping at limit.
+
+    Counts the same non-overlapping matches as hay.count(term), but stops
+    searching once limit is reached instead of scanning to the end.
+    """
+    find = hay.find
+    step = len(term)
+    pos = 0
+    while count < limit:
+        i = find(term, pos)
+        if i < 0:
+            break
+        count += 1
+        pos = i + step
+    return count
+
+
+def _count_in_file(path: str, strings: list, processed: list, processed_b: list,
+                   case_sensitive: bool, ascii_terms: bool = False,
+                   max_count: int | None = None, cut_bytes: bytes = b"") -> list | None:
+    """
+    Count occurrences of each search term in a single file.
+
+    Binary files are skipped. The file is read as raw bytes, piece by piece
+    (see iter_text_chunks; search strings never contain a newline, and
+    cut_bytes lists bytes that occur in no term, so no match can span two
+    pieces), and where possible searched without decoding it:
+    - case-sensitive: the UTF-8 encoded terms are counted in the raw bytes
+    - case-insensitive, pure-ASCII piece, or all terms ASCII (ascii_terms)
+      and the piece holds neither U+0130 nor U+212A (see _LOWER_TO_ASCII):
+      the bytes are lowercased directly
+    - case-insensitive, other pieces: decoded and lowercased as text, since
+      str.lower() handles non-ASCII letters that bytes.lower() does not
+
+    With max_count, each term is counted up to max_count only, and the rest
+    of the file is not read once every term has reached it.
+
+    Returns the count of each search string, in the order of strings,
+    or None if the file cannot be read.
+    """
+    try:
+        totals = [0] * len(strings)
+        for data in iter_text_chunks(path, cut_bytes=cut_bytes):
+            if case_sensitive:
+                hay, terms = data, processed_b
+            elif data.isascii() or (ascii_terms and not any(b in data for b in _LOWER_TO_ASCII)):
+                hay, terms = data.lower(), processed_b
+            else:
+                hay, terms = data.decode("utf-8", errors="ignore").lower(), processed
+
+            if max_count is None:
+                for i, term in enumerate(terms):
+                    totals[i] += hay.count(term)
+                continue
+
+            for i, term in enumerate(terms):
+                totals[i] = _count_upto(hay, term, totals[i], max_count)
+            if min(totals) >= max_count:
+                break
+
+        return totals
+    except Exception:
+        return None
+
+
+def _count_single_term(path: str, term_b: bytes, cut_bytes: bytes = b"") -> list | None:
+    """
+    Specialized _count_in_file() for the common case of one
+    case-sensitive search string: one bytes.count() per piece of raw data.
+    """
+    try:
+        return [sum(data.count(term_b) for data in iter_text_chunks(path, cut_bytes=cut_bytes))]
+    except Exception:
+        return None
+
+
+def _scan_with_cache(path: str, scan, cache: dict, racy_after_ns: int) -> tuple:
+    """
+    Run scan(path), or reuse the cached counts if the file's size and
+    modification time still match its cache entry.
+
+    Returns (counts, entry): the per-string counts as scan() returns them,
+    and the cache entry to keep for the file ([mtime_ns, size, counts],
+    see scan_cache), or None if the file should not be cached. Files that
+    could not be read (counts None) are never cached, so they are tried
+    again on the next run.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return scan(path), None
+
+    stamp = [st.st_mtime_ns, st.st_size]
+    entry = cache.get(path)
+    if entry is not None and entry[:2] == stamp:
+        return entry[2], entry
+
+    counts = scan(path)
+    if counts is None or st.st_mtime_ns >= racy_after_ns:
+        return counts, None
+    # Files without matches are cached with an empty list
+    return counts, stamp + [counts if any(counts) else []]
+
+
+def _cut_bytes(terms_b: list, case_sensitive: bool) -> bytes:
+    """
+    Return the ASCII bytes that occur in no search term (in either case,
+    for a case-insensitive search). Long lines are cut after one of them
+    (see iter_text_chunks), which can never split a match.
+    """
+    used = b"".join(terms_b)
+    if not case_sensitive:
+        used += used.upper()
+    return bytes(b for b in range(1, 128) if b not in used)
+
+
+def _build_scanner(strings: list, case_sensitive: bool, max_count: int | None):
+    """
+    Return the per-file scan function for a search, with the processed
+    (lowercased / encoded) terms bound in.
+
+    The function takes a path and returns the count of each string, or
+    None if the file cannot be read.
+    """
+    processed = strings if case_sensitive else [s.lower() for s in strings]
+    processed_b = [s.encode("utf-8") for s in processed]
+    cut_bytes = _cut_bytes(processed_b, case_sensitive)
+
+    if case_sensitive and len(strings) == 1 and max_count is None:
+        return partial(_count_single_term, term_b=processed_b[0], cut_bytes=cut_bytes)
+    return partial(
+        _count_in_file,
+        strings=strings,
+        processed=processed,
+        processed_b=processed_b,
+        case_sensitive=case_sensitive,
+        ascii_terms=all(t.isascii() for t in processed),
+        max_count=max_count,
+        cut_bytes=cut_bytes,
+    )
 
 
 def run(entry_file: str, cfg: dict, directory: str, case_sensitive: bool,
-        excluded_dirs: set, excluded_exts: set, included_exts: set) -> str | None:
+        excluded_dirs: set, excluded_exts: set, included_exts: set,
+        max_count: int | None = None) -> str | None:
     strings = load_search_strings(entry_file)
     if not strings:
         print("No search strings provided. Exiting.")
         return None
 
-    processed = strings if case_sensitive else [s.lower() for s in strings]
-    results = {}
+    # Matches are kept column-wise rather than as one small dict per file:
+    # file i (paths[i]) has its nonzero counts at offsets[i]:offsets[i + 1]
+    # of term_ids (index into strings) and counts.
+    results = {
+        "paths": [],
+        "offsets": array("q", [0]),
+        "term_ids": array("q"),
+        "counts": array("q"),
+    }
 
+    # Skip the program file itself, and the search cache (it lists the
+    # previous run's file paths, which may contain the search strings)
     script_path = os.path.abspath(entry_file)
+    paths = list(iter_files(
+        directory, excluded_dirs, excluded_exts, included_exts,
+        skip_paths=(script_path, search_cache_path(entry_file)), skip_binary_exts=True,
+    ))
+
+    scan = _build_scanner(strings, case_sensitive, max_count)
 
-    for path in iter_files(directory, excluded_dirs, excluded_exts, included_exts):
-        if os.path.abspath(path) == script_path:
-            continue
-        try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                text = f.read()
-            hay = text if case_sensitive else text.lower()
-            counts = {}
-            for orig, term in zip(strings, processed):
-                c = hay.count(term)
+    # Files whose size and modification time match the previous run of the
+    # same search are not read again.
+    key = search_key(directory, strings, case_sensitive, max_count)
+    cache = load_search_cache(entry_file, key, len(strings))
+    new_cache = {}
+    scan = partial(
+        _scan_with_cache,
+        scan=scan,
+        cache=cache,
+        racy_after_ns=time.time_ns() - CACHE_RACY_WINDOW_NS,
+    )
+
+    # Files are read and scanned by a thread pool (reads overlap on I/O),
+    # small runs of files per task; results are merged here in traversal
+    # order.
+    # Bound appends, so the loop does no per-file lookups into results
+    add_path = results["paths"].append
+    add_offset = results["offsets"].append
+    add_term_id = results["term_ids"].append
+    count_col = results["counts"]
+    add_count = count_col.append
+
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+        for path, (counts, entry) in zip(paths, map_in_batches(pool, scan, paths)):
+            if entry is not None:
+                new_cache[path] = entry
+            if not counts or not any(counts):
+                continue
+            add_path(path)
+            for i, c in enumerate(counts):
                 if c:
-                    counts[orig] = c
-            if counts:
-                results[path] = counts
-        except Exception:
-            continue
-
-    out = write_search_report(entry_file, directory, case_sensitive, strings, results)
-    return out
\ No newline at end of file
+                    add_term_id(i)
+                    add_count(c)
+            add_offset(len(count_col))
+
+    if new_cache != cache:
+        save_search_cache(entry_file, key, new_cache)
+
+    out = write_search_report(entry_file, directory, case_sensitive, strings, results, max_count)
+    return out
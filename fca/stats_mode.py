@@ -14,39 +14,129 @@ Report formatting is handled by the reporting module.
 """
 
 import os
-from fca.traversal import iter_files
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from fca.traversal import iter_files, iter_text_chunks, map_in_batches, IO_WORKERS
 from fca.reporting import write_stats_report
 
+# Counting (splitlines/split) is CPU-bound, so larger runs are spread over
+# worker processes on multi-core machines. Below this many files, process
+# startup costs more than it saves and a thread pool is used instead.
+PROCESS_POOL_MIN_FILES = 200
+
+# Paths handed to a worker process per task (amortizes pickling overhead).
+PROCESS_CHUNKSIZE = 64
+
+# Bytes a long line may be cut after (see iter_text_chunks): whitespace, so
+# no word is split. "\r" is left out, so "\r\n" is never split either.
+STATS_CUT_BYTES = b" \t\x0b\x0c"
+
+# Characters str.splitlines() ends a line at
+LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+def _file_stats(path: str) -> tuple | None:
+    """
+    Count lines, words, and characters in a single file.
+
+    The file is read in pieces (see iter_text_chunks), so large files are
+    never decoded in full. Every piece ends on whitespace, so per-piece
+    word and character counts add up to the same totals as counting the
+    whole text at once. Pieces normally end on a line break; when a long
+    line is cut, its rest in the next piece is not counted as a new line.
+
+    Returns (lines, words, chars), or None if the file cannot be read
+    or looks binary.
+    """
+    lines = words = chars = 0
+    try:
+        empty = True
+        # True while the last piece ended inside a line
+        open_line = False
+        for piece in iter_text_chunks(path, cut_bytes=STATS_CUT_BYTES):
+            empty = False
+            # Same text as a universal-newlines read ("\r\n" and "\r" become "\n")
+            text = piece.decode("utf-8", errors="ignore")
+            if not text:
+                continue
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            n = len(text.splitlines())
+            if open_line:
+                # The first line continues the last piece's line
+                n -= 1
+            lines += n
+            words += len(text.split())
+            chars += len(text)
+            open_line = text[-1] not in LINE_BREAKS
+        # No pieces means the file is either empty or binary
+        if empty and os.path.getsize(path):
+            return None
+    except Exception:
+        return None
+    return lines, words, chars
+
 
 def run(entry_file: str, directory: str,
         excluded_dirs: set, excluded_exts: set, included_exts: set) -> str:
-    per_file = {}
+    # Per-file stats are kept column-wise (one array per field, same index
+    # = same file) rather than as one small dict per file.
+    per_file = {
+        "paths": [],
+        "lines": array("q"),
+        "words": array("q"),
+        "chars": array("q"),
+    }
+    # Map: ext -> [files, lines, words, chars]
     per_ext = {}
 
+    # Skip the program file itself
     script_path = os.path.abspath(entry_file)
+    paths = list(iter_files(
+        directory, excluded_dirs, excluded_exts, included_exts,
+        skip_paths=(script_path,), skip_binary_exts=True,
+    ))
+
+    # Files are read and counted by a worker pool; results are aggregated
+    # here in traversal order.
+    use_processes = len(paths) >= PROCESS_POOL_MIN_FILES and (os.cpu_count() or 1) > 1
+    if use_processes:
+        pool = ProcessPoolExecutor()
+    else:
+        pool = ThreadPoolExecutor(max_workers=IO_WORKERS)
+
+    # Bound appends, so the loop does no per-file lookups into per_file
+    add_path = per_file["paths"].append
+    add_lines = per_file["lines"].append
+    add_words = per_file["words"].append
+    add_chars = per_file["chars"].append
+
+    with pool:
+        if use_processes:
+            all_stats = pool.map(_file_stats, paths, chunksize=PROCESS_CHUNKSIZE)
+        else:
+            all_stats = map_in_batches(pool, _file_stats, paths)
 
-    for path in iter_files(directory, excluded_dirs, excluded_exts, included_exts):
-        if os.path.abspath(path) == script_path:
-            continue
-        try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                text = f.read()
+        for path, stats in zip(paths, all_stats):
+            if stats is None:
+                continue
+            lines, words, chars = stats
 
             ext = os.path.splitext(path)[1].lower().lstrip(".") or "(none)"
-            lines = len(text.splitlines())
-            words = len(text.split())
-            chars = len(text)
 
-            per_file[path] = {"lines": lines, "words": words, "chars": chars}
+            add_path(path)
+            add_lines(lines)
+            add_words(words)
+            add_chars(chars)
 
-            if ext not in per_ext:
-                per_ext[ext] = {"files": 0, "lines": 0, "words": 0, "chars": 0}
-            per_ext[ext]["files"] += 1
-            per_ext[ext]["lines"] += lines
-            per_ext[ext]["words"] += words
-            per_ext[ext]["chars"] += chars
-        except Exception:
-            continue
+            totals = per_ext.get(ext)
+            if totals is None:
+                totals = per_ext[ext] = [0, 0, 0, 0]
+            totals[0] += 1
+            totals[1] += lines
+            totals[2] += words
+            totals[3] += chars
 
     out = write_stats_report(entry_file, directory, per_file, per_ext)
-    return out
\ No newline at end of file
+    return out
@@ -5,24 +5,265 @@ This module provides a single, centralized generator for walking
 directory trees while applying filtering rules.
 
 Responsibilities:
-- recursive directory traversal
+- recursive directory traversal (os.scandir based)
 - directory exclusion (e.g. .venv, .vscode)
 - include-only extension filtering
 - exclude extension filtering
+- reading file contents for the content modes, skipping binary files
 
 All file iteration in the application flows through this module,
 ensuring consistent behavior across modes.
 """
 
 import os
+from functools import partial
 
-def iter_files(start_dir: str, excluded_dirs: set, excluded_exts: set, included_exts: set):
-    for root, dirs, files in os.walk(start_dir):
-        dirs[:] = [d for d in dirs if d not in excluded_dirs]
-        for name in files:
-            ext = os.path.splitext(name)[1].lower().lstrip(".")
-            if included_exts and ext not in included_exts:
-                continue
-            if ext in excluded_exts:
+# Worker count for thread pools that mostly wait on file I/O
+# (reading files, walking directories).
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Most files a thread-pool task reads. Many small files are handed to the
+# workers in batches, since per-task overhead rivals the cost of reading a
+# tiny file.
+IO_BATCH_SIZE = 64
+
+# A NUL byte within this many leading bytes marks a file as binary.
+BINARY_SNIFF_SIZE = 4096
+
+# Approximate size of the pieces iter_text_chunks() reads large files in.
+TEXT_CHUNK_SIZE = 4 << 20
+
+# Extensions of formats that are binary by definition (compressed or with
+# NUL bytes in their headers). The content modes skip these files without
+# opening them; the NUL-byte sniff would reject them after a read anyway.
+BINARY_EXTS = frozenset({
+    "png", "jpg", "jpeg", "gif", "bmp", "ico", "webp", "tif", "tiff",
+    "zip", "gz", "tgz", "bz2", "xz", "7z", "rar", "jar", "whl",
+    "exe", "dll", "so", "dylib", "o", "a", "class", "pyc", "pyo",
+    "mp3", "mp4", "mov", "avi", "wav", "flac",
+    "woff", "woff2", "ttf", "otf", "eot",
+})
+
+
+def _ext_of(name: str) -> str:
+    """
+    Return the lowercased extension of a file name, without the dot.
+
+    Same result as os.path.splitext(name)[1].lower().lstrip("."), without
+    the tuple allocation: leading dots do not start an extension, so
+    ".bashrc" has no extension.
+    """
+    dot = name.rfind(".")
+    if dot <= 0 or name.count(".", 0, dot) == dot:
+        return ""
+    return name[dot + 1:].lower()
+
+
+def _ext_allowed(name: str, excluded_exts: set, included_exts: set) -> bool:
+    ext = _ext_of(name)
+    if included_exts and ext not in included_exts:
+        return False
+    return ext not in excluded_exts
+
+
+def _scan_dir(top: str, excluded_dirs: set, excluded_exts: set, included_exts: set) -> tuple:
+    """
+    List a single directory with os.scandir.
+
+    Returns a tuple (files, subdirs):
+    - files: DirEntry objects for files that pass the extension filters
+    - subdirs: paths of subdirectories to descend into (not excluded,
+      not symlinks)
+
+    Mirrors os.walk's defaults: unreadable directories are skipped silently,
+    symlinks to directories are neither listed as files nor followed.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(top) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    if entry.name not in excluded_dirs and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif _ext_allowed(entry.name, excluded_exts, included_exts):
+                    files.append(entry)
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def _walk_entries(start_dir: str, excluded_dirs: set, excluded_exts: set, included_exts: set):
+    """
+    Yield (root, DirEntry) for every file under start_dir that passes the
+    filters, in the same top-down order as os.walk.
+    """
+    stack = [start_dir]
+    while stack:
+        top = stack.pop()
+        files, subdirs = _scan_dir(top, excluded_dirs, excluded_exts, included_exts)
+        for entry in files:
+            yield top, entry
+        # Reversed so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+def iter_file_names(start_dir: str, excluded_dirs: set, excluded_exts: set, included_exts: set):
+    """
+    Walk start_dir and yield (root, name) pairs for every file that passes
+    the directory and extension filters.
+
+    Callers that only need the file name (e.g. filename search) can use this
+    to avoid building a full path for every file they end up discarding.
+    """
+    for root, entry in _walk_entries(start_dir, excluded_dirs, excluded_exts, included_exts):
+        yield root, entry.name
+
+
+def file_id(path: str) -> tuple | None:
+    """
+    Return (st_dev, st_ino) for path, or None if it cannot be stat'ed.
+
+    Paths with the same id are the same file (as os.path.samefile decides),
+    however they are spelled, e.g. relative or through a symlinked directory.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def iter_files(start_dir: str, excluded_dirs: set, excluded_exts: set, included_exts: set,
+               skip_paths: tuple = (), skip_binary_exts: bool = False):
+    """
+    Walk start_dir and yield the path of every file that passes the
+    directory and extension filters.
+
+    Files listed in skip_paths (e.g. the entry script) are left out. Files
+    are compared by file_id(), so they are found even when start_dir
+    reaches them by another path. Only files with the same name as one of
+    them are stat'ed for the comparison, so the check costs nothing for
+    all other files. Paths that do not exist are ignored.
+
+    If skip_binary_exts is True, files with an extension in BINARY_EXTS are
+    left out as well (for modes that read file contents). They are simply
+    added to the excluded extensions, so this adds no per-file work.
+    """
+    if skip_binary_exts:
+        excluded_exts = BINARY_EXTS.union(excluded_exts)
+    # Map: file name -> ids of the files to skip with that name
+    skip_ids = {}
+    for path in skip_paths:
+        fid = file_id(path)
+        if fid is not None:
+            skip_ids.setdefault(os.path.basename(path), set()).add(fid)
+
+    for _, entry in _walk_entries(start_dir, excluded_dirs, excluded_exts, included_exts):
+        if entry.name in skip_ids and file_id(entry.path) in skip_ids[entry.name]:
+            continue
+        yield entry.path
+
+
+def split_top_level(start_dir: str, excluded_dirs: set, excluded_exts: set, included_exts: set) -> tuple:
+    """
+    List only the top level of start_dir, so the tree below it can be
+    walked in parallel (one task per subdirectory).
+
+    Returns a tuple (files, subdirs):
+    - files: (root, name) pairs for top-level files that pass the filters
+    - subdirs: paths of top-level subdirectories that are not excluded
+
+    Walking every subdir with iter_file_names() and adding the top-level
+    files yields the same set of files as iter_file_names(start_dir, ...).
+    Symlinked directories are not included, matching os.walk's default.
+    """
+    files, subdirs = _scan_dir(start_dir, excluded_dirs, excluded_exts, included_exts)
+    return [(start_dir, e.name) for e in files], subdirs
+
+
+def _map_list(fn, items: list) -> list:
+    return [fn(item) for item in items]
+
+
+def map_in_batches(pool, fn, items: list):
+    """
+    Like pool.map(fn, items) for a thread pool, but hands items to the
+    workers in batches of up to IO_BATCH_SIZE.
+
+    Batches shrink as needed to leave at least four tasks per worker, so
+    short runs still overlap their I/O. Yields results in item order.
+    """
+    size = min(IO_BATCH_SIZE, len(items) // (IO_WORKERS * 4))
+    if size <= 1:
+        yield from pool.map(fn, items)
+        return
+
+    batches = [items[i:i + size] for i in range(0, len(items), size)]
+    for results in pool.map(partial(_map_list, fn), batches):
+        yield from results
+
+
+def iter_text_chunks(path: str, chunk_size: int = TEXT_CHUNK_SIZE, cut_bytes: bytes = b""):
+    """
+    Yield the raw contents of a text file in pieces of about chunk_size
+    bytes, so large files are never held in memory in full.
+
+    Every piece except the last ends just after a newline byte, so no line
+    is split across pieces (and, since a newline byte never occurs inside
+    a UTF-8 sequence, neither is any character). Anything that cannot span
+    a newline, such as a search string, can be counted per piece.
+
+    A block of chunk_size bytes without a newline is cut after the last of
+    its bytes found in cut_bytes instead: bytes that cannot be part of
+    anything the caller counts (e.g. whitespace for word counts). They
+    must be ASCII, so no character is split either. Without cut_bytes, or
+    if a long run contains none of them, the run is yielded in one piece.
+
+    Yields nothing for binary files: only the first BINARY_SNIFF_SIZE bytes
+    are read to decide (a NUL byte there means binary, the same heuristic
+    git uses), so large binaries such as images or archives are never read
+    in full. Yields nothing for empty files either.
+    Raises OSError if the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        head = f.read(BINARY_SNIFF_SIZE)
+        if b"\0" in head:
+            return
+        if len(head) < BINARY_SNIFF_SIZE:
+            if head:
+                yield head
+            return
+
+        # Maps every cut byte to a newline, so one rfind() finds the last one
+        cut_table = bytes.maketrans(cut_bytes, b"\n" * len(cut_bytes)) if cut_bytes else None
+
+        # Data after the last cut so far, kept as a list of blocks
+        # and joined once, so long newline-free runs are not copied on
+        # every read.
+        pending = [head]
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+            cut = block.rfind(b"\n") + 1
+            if cut == 0 and cut_table:
+                cut = block.translate(cut_table).rfind(b"\n") + 1
+            if cut == 0:
+                pending.append(block)
                 continue
-            yield os.path.join(root, name)
\ No newline at end of file
+            if not pending and cut == len(block):
+                yield block
+            else:
+                # memoryview slice: the block is copied once, into the result
+                pending.append(memoryview(block)[:cut])
+                yield b"".join(pending)
+            pending = [block[cut:]] if cut < len(block) else []
+
+        if pending:
+            yield b"".join(pending)
@@ -7,6 +7,14 @@ Currently covered:
 - extension list normalization
 - file traversal include/exclude behavior
 - excluded directory handling
+- top-level split used for parallel traversal
+- chunked reading of text files
+- file statistics over a long line read in pieces
+- filename pattern matching
+- string counting with and without a per-file cap
+- case-insensitive counting of ASCII terms in non-ASCII text
+- reuse of cached string-search counts
+- rejection of malformed cache entries
 
 Tests rely only on the Python standard library and use
 temporary directories to avoid touching real user files.
@@ -17,7 +25,11 @@ import tempfile
 import unittest
 
 from fca.config import normalize_ext_list
-from fca.traversal import iter_files
+from fca.traversal import iter_files, iter_file_names, iter_text_chunks, split_top_level, _ext_of, TEXT_CHUNK_SIZE
+from fca.name_search_mode import _compile_patterns, _matches_any_pattern
+from fca.search_mode import _count_in_file, _scan_with_cache
+from fca.stats_mode import _file_stats
+from fca.scan_cache import load_search_cache, save_search_cache
 
 
 class TestCore(unittest.TestCase):
@@ -55,6 +67,165 @@ class TestCore(unittest.TestCase):
             found2 = sorted(os.path.relpath(p, td) for p in iter_files(td, excluded_dirs, set(), included_exts))
             self.assertEqual(found2, ["a.py"])
 
+    def test_ext_of_matches_splitext(self):
+        for name in ["a.py", "b.TXT", ".bashrc", "..x", "a.", "a..b", ".a.B", "noext", "x.tar.gz"]:
+            self.assertEqual(_ext_of(name), os.path.splitext(name)[1].lower().lstrip("."), name)
+
+    def test_split_top_level_covers_tree(self):
+        with tempfile.TemporaryDirectory() as td:
+            os.makedirs(os.path.join(td, ".venv"), exist_ok=True)
+            os.makedirs(os.path.join(td, "src", "pkg"), exist_ok=True)
+            for rel in ("a.py", "b.js", os.path.join("src", "c.py"),
+                        os.path.join("src", "pkg", "d.py"), os.path.join(".venv", "e.py")):
+                with open(os.path.join(td, rel), "w", encoding="utf-8") as f:
+                    f.write("x\n")
+
+            args = ({".venv"}, {"js"}, set())
+            files, subdirs = split_top_level(td, *args)
+            for sub in subdirs:
+                files.extend(iter_file_names(sub, *args))
+
+            self.assertEqual(sorted(files), sorted(iter_file_names(td, *args)))
+            self.assertEqual(subdirs, [os.path.join(td, "src")])
+
+    def test_iter_text_chunks_splits_at_newlines(self):
+        with tempfile.TemporaryDirectory() as td:
+            text_path = os.path.join(td, "a.txt")
+            data = "".join(f"line {i} foo\n" for i in range(2000)).encode("utf-8") + b"tail"
+            with open(text_path, "wb") as f:
+                f.write(data)
+
+            chunks = list(iter_text_chunks(text_path, chunk_size=1000))
+            self.assertGreater(len(chunks), 1)
+            self.assertEqual(b"".join(chunks), data)
+            for chunk in chunks[:-1]:
+                self.assertTrue(chunk.endswith(b"\n"))
+
+            # No newline at all: one piece, however many reads it takes
+            line_path = os.path.join(td, "line.txt")
+            line = b"x" * 50000
+            with open(line_path, "wb") as f:
+                f.write(line)
+            self.assertEqual(list(iter_text_chunks(line_path, chunk_size=1000)), [line])
+
+            # Long line: cut after the last cut byte of each block instead
+            words_path = os.path.join(td, "words.txt")
+            words = b"ab " * 20000
+            with open(words_path, "wb") as f:
+                f.write(words)
+            chunks = list(iter_text_chunks(words_path, chunk_size=1000, cut_bytes=b" "))
+            self.assertEqual(b"".join(chunks), words)
+            self.assertLessEqual(max(map(len, chunks)), 4096 + 1000)
+            for chunk in chunks[:-1]:
+                self.assertTrue(chunk.endswith(b" "))
+
+            bin_path = os.path.join(td, "b.bin")
+            with open(bin_path, "wb") as f:
+                f.write(b"abc\0def" * 1000)
+            self.assertEqual(list(iter_text_chunks(bin_path)), [])
+
+    def test_file_stats_long_line(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "a.txt")
+            # One line longer than a read block, so it is cut mid-line
+            text = "word\t" * (TEXT_CHUNK_SIZE // 4) + "end\r\nnext line\n"
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+            expected = text.replace("\r\n", "\n")
+            self.assertEqual(
+                _file_stats(path),
+                (len(expected.splitlines()), len(expected.split()), len(expected)),
+            )
+
+    def test_matches_any_pattern(self):
+        patterns = ["*.PY", "setup.py", "*.txt"]
+
+        matcher = _compile_patterns(patterns, case_sensitive=False)
+        self.assertCountEqual(_matches_any_pattern("Setup.py", matcher, False), ["*.PY", "setup.py"])
+        self.assertEqual(_matches_any_pattern("notes.TXT", matcher, False), ["*.txt"])
+        self.assertEqual(_matches_any_pattern("main.js", matcher, False), [])
+
+        matcher = _compile_patterns(patterns, case_sensitive=True)
+        self.assertEqual(_matches_any_pattern("setup.py", matcher, True), ["setup.py"])
+        self.assertEqual(_matches_any_pattern("notes.TXT", matcher, True), [])
+
+    def test_count_in_file_max_count(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "a.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("aaaa Foo foo\n" * 3)
+
+            strings = ["aa", "foo"]
+            args = (path, strings, strings, [s.encode("utf-8") for s in strings], False)
+            self.assertEqual(_count_in_file(*args), [6, 6])
+            self.assertEqual(_count_in_file(*args, max_count=4), [4, 4])
+            self.assertEqual(_count_in_file(*args, max_count=10), [6, 6])
+
+    def test_count_in_file_non_ascii_lowercase(self):
+        # "\u212a" (Kelvin sign) lowercases to "k" and "\u0130" to "i\u0307",
+        # so ASCII terms must not skip decoding a piece holding them
+        with tempfile.TemporaryDirectory() as td:
+            for text in ("\u212a ki \u0130 K I caf\u00e9\n", "caf\u00e9 K I ki\n"):
+                path = os.path.join(td, "a.txt")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text)
+
+                strings = ["k", "i"]
+                args = (path, strings, strings, [s.encode("utf-8") for s in strings], False)
+                expected = [text.lower().count(s) for s in strings]
+                self.assertEqual(_count_in_file(*args, ascii_terms=True), expected)
+
+    def test_scan_with_cache(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "a.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("foo bar foo\n")
+            os.utime(path, ns=(10**18, 10**18))
+
+            scanned = []
+
+            def scan(p):
+                scanned.append(p)
+                return [2, 1, 0]
+
+            counts, entry = _scan_with_cache(path, scan, {}, racy_after_ns=2 * 10**18)
+            self.assertEqual(counts, [2, 1, 0])
+            self.assertEqual(entry, [10**18, 12, [2, 1, 0]])
+
+            # Unchanged file: counts come from the cache
+            counts, _ = _scan_with_cache(path, scan, {path: entry}, racy_after_ns=2 * 10**18)
+            self.assertEqual(counts, [2, 1, 0])
+            self.assertEqual(len(scanned), 1)
+
+            # Changed modification time: scanned again
+            os.utime(path, ns=(10**18 + 1, 10**18 + 1))
+            _scan_with_cache(path, scan, {path: entry}, racy_after_ns=2 * 10**18)
+            self.assertEqual(len(scanned), 2)
+
+            # Recently modified: not cached
+            _, entry = _scan_with_cache(path, scan, {}, racy_after_ns=10**18)
+            self.assertIsNone(entry)
+
+            # Unreadable (scan failed): reported as such and not cached
+            counts, entry = _scan_with_cache(path, lambda p: None, {}, racy_after_ns=2 * 10**18)
+            self.assertIsNone(counts)
+            self.assertIsNone(entry)
+
+    def test_load_search_cache_drops_malformed_entries(self):
+        with tempfile.TemporaryDirectory() as td:
+            entry_file = os.path.join(td, "main.py")
+            good = [10**18, 12, [2, 1]]
+            save_search_cache(entry_file, "k", {
+                "good": good,
+                "none": [10**18, 5, []],
+                "short": [10**18, 12],
+                "wrong_len": [10**18, 12, [2]],
+                "bad_count": [10**18, 12, ["2", 1]],
+                "not_list": "x",
+            })
+            self.assertEqual(load_search_cache(entry_file, "k", 2), {"good": good, "none": [10**18, 5, []]})
+            self.assertEqual(load_search_cache(entry_file, "other", 2), {})
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file